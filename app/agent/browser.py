@@ -1,4 +1,3 @@
-import json
 from typing import TYPE_CHECKING, Optional
 
 from pydantic import Field, model_validator
@@ -15,26 +14,25 @@ if TYPE_CHECKING:
     from app.agent.base import BaseAgent  # Or wherever memory is defined
 
 
+# Read from the field default so lookups don't build a whole BrowserUseTool
+BROWSER_TOOL_NAME: str = BrowserUseTool.model_fields["name"].default
+
+
 class BrowserContextHelper:
     def __init__(self, agent: "BaseAgent"):
         self.agent = agent
         self._current_base64_image: Optional[str] = None
 
     async def get_browser_state(self) -> Optional[dict]:
-        browser_tool = self.agent.available_tools.get_tool(BrowserUseTool().name)
-        if not browser_tool or not hasattr(browser_tool, "get_current_state"):
-            logger.warning("BrowserUseTool not found or doesn't have get_current_state")
+        browser_tool = self.agent.available_tools.get_tool(BROWSER_TOOL_NAME)
+        if not browser_tool or not hasattr(browser_tool, "get_state_dict"):
+            logger.warning("BrowserUseTool not found or doesn't have get_state_dict")
             return None
         try:
-            result = await browser_tool.get_current_state()
-            if result.error:
-                logger.debug(f"Browser state error: {result.error}")
-                return None
-            if hasattr(result, "base64_image") and result.base64_image:
-                self._current_base64_image = result.base64_image
-            else:
-                self._current_base64_image = None
-            return json.loads(result.output)
+            # Read the state dict directly instead of decoding the tool's JSON
+            state, screenshot = await browser_tool.get_state_dict()
+            self._current_base64_image = screenshot or None
+            return state
         except Exception as e:
             logger.debug(f"Failed to get browser state: {str(e)}")
             return None
@@ -74,7 +72,7 @@ class BrowserContextHelper:
         )
 
     async def cleanup_browser(self):
-        browser_tool = self.agent.available_tools.get_tool(BrowserUseTool().name)
+        browser_tool = self.agent.available_tools.get_tool(BROWSER_TOOL_NAME)
         if browser_tool and hasattr(browser_tool, "cleanup"):
             await browser_tool.cleanup()
 
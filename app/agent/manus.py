@@ -2,7 +2,7 @@ from typing import Dict, List, Optional
 
 from pydantic import Field, model_validator
 
-from app.agent.browser import BrowserContextHelper
+from app.agent.browser import BROWSER_TOOL_NAME, BrowserContextHelper
 from app.agent.toolcall import ToolCallAgent
 from app.config import config
 from app.logger import logger
@@ -144,9 +144,10 @@ class Manus(ToolCallAgent):
             self._initialized = True
 
         original_prompt = self.next_step_prompt
-        recent_messages = self.memory.messages[-3:] if self.memory.messages else []
+        # Slicing already yields [] for an empty history; resolve the list once
+        recent_messages = self.memory.messages[-3:]
         browser_in_use = any(
-            tc.function.name == BrowserUseTool().name
+            tc.function.name == BROWSER_TOOL_NAME
             for msg in recent_messages
             if msg.tool_calls
             for tc in msg.tool_calls
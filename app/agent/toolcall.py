@@ -1,5 +1,6 @@
 import asyncio
 import json
+from functools import lru_cache
 from typing import Any, List, Optional, Union
 
 from pydantic import Field
@@ -15,6 +16,12 @@ from app.tool import CreateChatCompletion, Terminate, ToolCollection
 TOOL_CALL_REQUIRED = "Tool calls required but none provided"
 
 
+@lru_cache(maxsize=None)
+def _has_async_cleanup(tool_type: type) -> bool:
+    """Whether a tool class defines a coroutine ``cleanup``, answered once per class."""
+    return asyncio.iscoroutinefunction(getattr(tool_type, "cleanup", None))
+
+
 class ToolCallAgent(ReActAgent):
     """Base agent class for handling tool/function calls with enhanced abstraction"""
 
@@ -32,6 +39,7 @@ class ToolCallAgent(ReActAgent):
 
     tool_calls: List[ToolCall] = Field(default_factory=list)
     _current_base64_image: Optional[str] = None
+    _system_msgs: Optional[List[Message]] = None
 
     max_steps: int = 30
     max_observe: Optional[Union[int, bool]] = None
@@ -46,11 +54,7 @@ class ToolCallAgent(ReActAgent):
             # Get response with tool options
             response = await self.llm.ask_tool(
                 messages=self.messages,
-                system_msgs=(
-                    [Message.system_message(self.system_prompt)]
-                    if self.system_prompt
-                    else None
-                ),
+                system_msgs=self._get_system_msgs(),
                 tools=self.available_tools.to_params(),
                 tool_choice=self.tool_choices,
             )
@@ -58,7 +62,7 @@ class ToolCallAgent(ReActAgent):
             raise
         except Exception as e:
             # Check if this is a RetryError containing TokenLimitExceeded
-            if hasattr(e, "__cause__") and isinstance(e.__cause__, TokenLimitExceeded):
+            if isinstance(e.__cause__, TokenLimitExceeded):
                 token_limit_error = e.__cause__
                 logger.error(
                     f"🚨 Token limit error (from RetryError): {token_limit_error}"
@@ -128,6 +132,17 @@ class ToolCallAgent(ReActAgent):
             )
             return False
 
+    def _get_system_msgs(self) -> Optional[List[Message]]:
+        """Return the system prompt message, rebuilt only when the prompt changes"""
+        if not self.system_prompt:
+            return None
+        if (
+            self._system_msgs is None
+            or self._system_msgs[0].content != self.system_prompt
+        ):
+            self._system_msgs = [Message.system_message(self.system_prompt)]
+        return self._system_msgs
+
     async def act(self) -> str:
         """Execute tool calls and handle their results"""
         if not self.tool_calls:
@@ -184,9 +199,10 @@ class ToolCallAgent(ReActAgent):
             await self._handle_special_tool(name=name, result=result)
 
             # Check if result is a ToolResult with base64_image
-            if hasattr(result, "base64_image") and result.base64_image:
+            base64_image = getattr(result, "base64_image", None)
+            if base64_image:
                 # Store the base64_image for later use in tool_message
-                self._current_base64_image = result.base64_image
+                self._current_base64_image = base64_image
 
             # Format result for display (standard case)
             observation = (
@@ -229,17 +245,24 @@ class ToolCallAgent(ReActAgent):
     async def cleanup(self):
         """Clean up resources used by the agent's tools."""
         logger.info(f"🧹 Cleaning up resources for agent '{self.name}'...")
-        for tool_name, tool_instance in self.available_tools.tool_map.items():
-            if hasattr(tool_instance, "cleanup") and asyncio.iscoroutinefunction(
-                tool_instance.cleanup
-            ):
-                try:
-                    logger.debug(f"🧼 Cleaning up tool: {tool_name}")
-                    await tool_instance.cleanup()
-                except Exception as e:
-                    logger.error(
-                        f"🚨 Error cleaning up tool '{tool_name}': {e}", exc_info=True
-                    )
+
+        async def cleanup_tool(tool_name: str, tool_instance: Any) -> None:
+            try:
+                logger.debug(f"🧼 Cleaning up tool: {tool_name}")
+                await tool_instance.cleanup()
+            except Exception as e:
+                logger.error(
+                    f"🚨 Error cleaning up tool '{tool_name}': {e}", exc_info=True
+                )
+
+        # Tools clean up independently of each other, so release them concurrently
+        await asyncio.gather(
+            *(
+                cleanup_tool(tool_name, tool_instance)
+                for tool_name, tool_instance in self.available_tools.tool_map.items()
+                if _has_async_cleanup(type(tool_instance))
+            )
+        )
         logger.info(f"✨ Cleanup complete for agent '{self.name}'.")
 
     async def run(self, request: Optional[str] = None) -> str:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import sys
 import time
@@ -28,9 +29,10 @@ class OpenAIResponse:
             setattr(self, key, value)
 
     def model_dump(self, *args, **kwargs):
-        # Convert object to dict and add timestamp
+        # Convert object to dict and add timestamp (formatted on first dump only)
         data = self.__dict__
-        data["created_at"] = datetime.now().isoformat()
+        if "created_at" not in data:
+            data["created_at"] = datetime.now().isoformat()
         return data
 
 
@@ -207,7 +209,9 @@ class ChatCompletions:
             system_prompt,
             bedrock_messages,
         ) = self._convert_openai_messages_to_bedrock_format(messages)
-        response = self.client.converse(
+        # Run the blocking boto3 call off the event loop
+        response = await asyncio.to_thread(
+            self.client.converse,
             modelId=model,
             system=system_prompt,
             messages=bedrock_messages,
@@ -217,21 +221,16 @@ class ChatCompletions:
         openai_response = self._convert_bedrock_response_to_openai_format(response)
         return openai_response
 
-    async def _invoke_bedrock_stream(
+    def _read_bedrock_stream(
         self,
         model: str,
-        messages: List[Dict[str, str]],
+        system_prompt: List[dict],
+        bedrock_messages: List[dict],
         max_tokens: int,
         temperature: float,
-        tools: Optional[List[dict]] = None,
-        tool_choice: Literal["none", "auto", "required"] = "auto",
-        **kwargs,
-    ) -> OpenAIResponse:
-        # Streaming invocation of Bedrock model
-        (
-            system_prompt,
-            bedrock_messages,
-        ) = self._convert_openai_messages_to_bedrock_format(messages)
+        tools: Optional[List[dict]],
+    ) -> dict:
+        # Blocking streaming request; collects the events into a Bedrock response
         response = self.client.converse_stream(
             modelId=model,
             system=system_prompt,
@@ -292,6 +291,34 @@ class ChatCompletions:
                         "input"
                     ] = json.loads(bedrock_response_tool_input)
         print()
+        return bedrock_response
+
+    async def _invoke_bedrock_stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        tools: Optional[List[dict]] = None,
+        tool_choice: Literal["none", "auto", "required"] = "auto",
+        **kwargs,
+    ) -> OpenAIResponse:
+        # Streaming invocation of Bedrock model
+        (
+            system_prompt,
+            bedrock_messages,
+        ) = self._convert_openai_messages_to_bedrock_format(messages)
+        # Both the request and reading the event stream block on the network,
+        # so the whole exchange runs in a worker thread
+        bedrock_response = await asyncio.to_thread(
+            self._read_bedrock_stream,
+            model,
+            system_prompt,
+            bedrock_messages,
+            max_tokens,
+            temperature,
+            tools,
+        )
         openai_response = self._convert_bedrock_response_to_openai_format(
             bedrock_response
         )
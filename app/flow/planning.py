@@ -1,5 +1,7 @@
 import json
+import re
 import time
+from collections import Counter
 from enum import Enum
 from typing import Dict, List, Optional, Union
 
@@ -13,6 +15,10 @@ from app.schema import AgentState, Message, ToolChoice
 from app.tool import PlanningTool
 
 
+# Matches an executor tag such as [SEARCH] or [CODE] in a plan step
+_STEP_TYPE_PATTERN = re.compile(r"\[([A-Z_]+)\]")
+
+
 class PlanStepStatus(str, Enum):
     """Enum class defining possible statuses of a plan step"""
 
@@ -42,6 +48,14 @@ class PlanStepStatus(str, Enum):
         }
 
 
+# Statuses of steps that still need work, for constant-time membership checks
+_ACTIVE_STEP_STATUSES = frozenset(PlanStepStatus.get_active_statuses())
+
+# Status markers resolved once from the enum, plus the fallback for unknown statuses
+_STATUS_MARKS = PlanStepStatus.get_status_marks()
+_DEFAULT_STATUS_MARK = _STATUS_MARKS[PlanStepStatus.NOT_STARTED.value]
+
+
 class PlanningFlow(BaseFlow):
     """A flow that manages planning and execution of tasks using agents."""
 
@@ -125,7 +139,7 @@ class PlanningFlow(BaseFlow):
                 result += step_result + "\n"
 
                 # Check if agent wants to terminate
-                if hasattr(executor, "state") and executor.state == AgentState.FINISHED:
+                if executor.state == AgentState.FINISHED:
                     break
 
             return result
@@ -235,14 +249,12 @@ class PlanningFlow(BaseFlow):
                 else:
                     status = step_statuses[i]
 
-                if status in PlanStepStatus.get_active_statuses():
+                if status in _ACTIVE_STEP_STATUSES:
                     # Extract step type/category if available
                     step_info = {"text": step}
 
                     # Try to extract step type from the text (e.g., [SEARCH] or [CODE])
-                    import re
-
-                    type_match = re.search(r"\[([A-Z_]+)\]", step)
+                    type_match = _STEP_TYPE_PATTERN.search(step)
                     if type_match:
                         step_info["type"] = type_match.group(1).lower()
 
@@ -340,7 +352,7 @@ class PlanningFlow(BaseFlow):
             result = await self.planning_tool.execute(
                 command="get", plan_id=self.active_plan_id
             )
-            return result.output if hasattr(result, "output") else str(result)
+            return result.output
         except Exception as e:
             logger.error(f"Error getting plan: {e}")
             return self._generate_plan_text_from_storage()
@@ -364,11 +376,7 @@ class PlanningFlow(BaseFlow):
                 step_notes.append("")
 
             # Count steps by status
-            status_counts = {status: 0 for status in PlanStepStatus.get_all_statuses()}
-
-            for status in step_statuses:
-                if status in status_counts:
-                    status_counts[status] += 1
+            status_counts = Counter(step_statuses)
 
             completed = status_counts[PlanStepStatus.COMPLETED.value]
             total = len(steps)
@@ -384,15 +392,11 @@ class PlanningFlow(BaseFlow):
             plan_text += f"{status_counts[PlanStepStatus.BLOCKED.value]} blocked, {status_counts[PlanStepStatus.NOT_STARTED.value]} not started\n\n"
             plan_text += "Steps:\n"
 
-            status_marks = PlanStepStatus.get_status_marks()
-
             for i, (step, status, notes) in enumerate(
                 zip(steps, step_statuses, step_notes)
             ):
                 # Use status marks to indicate step status
-                status_mark = status_marks.get(
-                    status, status_marks[PlanStepStatus.NOT_STARTED.value]
-                )
+                status_mark = _STATUS_MARKS.get(status, _DEFAULT_STATUS_MARK)
 
                 plan_text += f"{i}. {status_mark} {step}\n"
                 if notes:
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 import tiktoken
@@ -41,6 +42,22 @@ MULTIMODAL_MODELS = [
     "claude-3-haiku-20240307",
 ]
 
+# Hashed once so per-message role validation is a set probe, not a tuple scan
+_VALID_ROLES = frozenset(ROLE_VALUES)
+
+# Tool schemas repeat on every agent step; their token counts are kept per text
+_TOOL_TOKEN_CACHE_SIZE = 256
+
+
+def _log_openai_error_hint(error: OpenAIError) -> None:
+    """Log a hint for the common OpenAI API failure kinds"""
+    if isinstance(error, AuthenticationError):
+        logger.error("Authentication failed. Check API key.")
+    elif isinstance(error, RateLimitError):
+        logger.error("Rate limit exceeded. Consider increasing retry attempts.")
+    elif isinstance(error, APIError):
+        logger.error(f"API error: {error}")
+
 
 class TokenCounter:
     # Token constants
@@ -148,23 +165,29 @@ class TokenCounter:
         """Calculate the total number of tokens in a message list"""
         total_tokens = self.FORMAT_TOKENS  # Base format tokens
 
+        # Bind per-message lookups once; this runs over the whole history per request
+        base_message_tokens = self.BASE_MESSAGE_TOKENS
+        count_text = self.count_text
+        count_content = self.count_content
+        count_tool_calls = self.count_tool_calls
+
         for message in messages:
-            tokens = self.BASE_MESSAGE_TOKENS  # Base tokens per message
+            tokens = base_message_tokens  # Base tokens per message
 
             # Add role tokens
-            tokens += self.count_text(message.get("role", ""))
+            tokens += count_text(message.get("role", ""))
 
             # Add content tokens
             if "content" in message:
-                tokens += self.count_content(message["content"])
+                tokens += count_content(message["content"])
 
             # Add tool calls tokens
             if "tool_calls" in message:
-                tokens += self.count_tool_calls(message["tool_calls"])
+                tokens += count_tool_calls(message["tool_calls"])
 
             # Add name and tool_call_id tokens
-            tokens += self.count_text(message.get("name", ""))
-            tokens += self.count_text(message.get("tool_call_id", ""))
+            tokens += count_text(message.get("name", ""))
+            tokens += count_text(message.get("tool_call_id", ""))
 
             total_tokens += tokens
 
@@ -197,14 +220,21 @@ class LLM:
             self.api_version = llm_config.api_version
             self.base_url = llm_config.base_url
 
+            # Model capabilities are fixed for the lifetime of the instance
+            self.supports_images = self.model in MULTIMODAL_MODELS
+            self.is_reasoning_model = self.model in REASONING_MODELS
+
+            # Token limit parameter, whose name depends on the model kind
+            self._token_limit_params = (
+                {"max_completion_tokens": self.max_tokens}
+                if self.is_reasoning_model
+                else {"max_tokens": self.max_tokens}
+            )
+
             # Add token counting related attributes
             self.total_input_tokens = 0
             self.total_completion_tokens = 0
-            self.max_input_tokens = (
-                llm_config.max_input_tokens
-                if hasattr(llm_config, "max_input_tokens")
-                else None
-            )
+            self.max_input_tokens = llm_config.max_input_tokens
 
             # Initialize tokenizer
             try:
@@ -225,6 +255,9 @@ class LLM:
                 self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
 
             self.token_counter = TokenCounter(self.tokenizer)
+            self._count_tool_tokens = lru_cache(maxsize=_TOOL_TOKEN_CACHE_SIZE)(
+                self.count_tokens
+            )
 
     def count_tokens(self, text: str) -> int:
         """Calculate the number of tokens in a text"""
@@ -235,6 +268,25 @@ class LLM:
     def count_message_tokens(self, messages: List[dict]) -> int:
         return self.token_counter.count_message_tokens(messages)
 
+    def _sampling_params(self, temperature: Optional[float]) -> dict:
+        """Build the configured token limit and effective temperature"""
+        params = dict(self._token_limit_params)
+        if not self.is_reasoning_model:
+            params["temperature"] = (
+                temperature if temperature is not None else self.temperature
+            )
+        return params
+
+    def _request_params(
+        self, messages: List[dict], temperature: Optional[float]
+    ) -> dict:
+        """Build chat completion parameters for the configured model"""
+        return {
+            "model": self.model,
+            "messages": messages,
+            **self._sampling_params(temperature),
+        }
+
     def update_token_count(self, input_tokens: int, completion_tokens: int = 0) -> None:
         """Update token counts"""
         # Only track tokens if max_input_tokens is set
@@ -301,8 +353,9 @@ class LLM:
                 if "role" not in message:
                     raise ValueError("Message dict must contain 'role' field")
 
-                # Process base64 images if present and model supports images
-                if supports_images and message.get("base64_image"):
+                # Take the image off the message; it is inlined below or dropped
+                base64_image = message.pop("base64_image", None)
+                if supports_images and base64_image:
                     # Initialize or convert content to appropriate format
                     if not message.get("content"):
                         message["content"] = []
@@ -326,29 +379,20 @@ class LLM:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{message['base64_image']}"
+                                "url": f"data:image/jpeg;base64,{base64_image}"
                             },
                         }
                     )
 
-                    # Remove the base64_image field
-                    del message["base64_image"]
-                # If model doesn't support images but message has base64_image, handle gracefully
-                elif not supports_images and message.get("base64_image"):
-                    # Just remove the base64_image field and keep the text content
-                    del message["base64_image"]
-
                 if "content" in message or "tool_calls" in message:
+                    # Validate the role while the message is at hand
+                    if message["role"] not in _VALID_ROLES:
+                        raise ValueError(f"Invalid role: {message['role']}")
                     formatted_messages.append(message)
                 # else: do not include the message
             else:
                 raise TypeError(f"Unsupported message type: {type(message)}")
 
-        # Validate all messages have required fields
-        for msg in formatted_messages:
-            if msg["role"] not in ROLE_VALUES:
-                raise ValueError(f"Invalid role: {msg['role']}")
-
         return formatted_messages
 
     @retry(
@@ -385,7 +429,7 @@ class LLM:
         """
         try:
             # Check if the model supports images
-            supports_images = self.model in MULTIMODAL_MODELS
+            supports_images = self.supports_images
 
             # Format system and user messages with image support check
             if system_msgs:
@@ -403,18 +447,7 @@ class LLM:
                 # Raise a special exception that won't be retried
                 raise TokenLimitExceeded(error_message)
 
-            params = {
-                "model": self.model,
-                "messages": messages,
-            }
-
-            if self.model in REASONING_MODELS:
-                params["max_completion_tokens"] = self.max_tokens
-            else:
-                params["max_tokens"] = self.max_tokens
-                params["temperature"] = (
-                    temperature if temperature is not None else self.temperature
-                )
+            params = self._request_params(messages, temperature)
 
             if not stream:
                 # Non-streaming request
@@ -438,15 +471,15 @@ class LLM:
             response = await self.client.chat.completions.create(**params, stream=True)
 
             collected_messages = []
-            completion_text = ""
             async for chunk in response:
                 chunk_message = chunk.choices[0].delta.content or ""
                 collected_messages.append(chunk_message)
-                completion_text += chunk_message
                 print(chunk_message, end="", flush=True)
 
             print()  # Newline after streaming
-            full_response = "".join(collected_messages).strip()
+            # Join once; the chunks already hold the full completion text
+            completion_text = "".join(collected_messages)
+            full_response = completion_text.strip()
             if not full_response:
                 raise ValueError("Empty response from streaming LLM")
 
@@ -467,12 +500,7 @@ class LLM:
             raise
         except OpenAIError as oe:
             logger.exception(f"OpenAI API error")
-            if isinstance(oe, AuthenticationError):
-                logger.error("Authentication failed. Check API key.")
-            elif isinstance(oe, RateLimitError):
-                logger.error("Rate limit exceeded. Consider increasing retry attempts.")
-            elif isinstance(oe, APIError):
-                logger.error(f"API error: {oe}")
+            _log_openai_error_hint(oe)
             raise
         except Exception:
             logger.exception(f"Unexpected error in ask")
@@ -515,7 +543,7 @@ class LLM:
         try:
             # For ask_with_images, we always set supports_images to True because
             # this method should only be called with models that support images
-            if self.model not in MULTIMODAL_MODELS:
+            if not self.supports_images:
                 raise ValueError(
                     f"Model {self.model} does not support images. Use a model from {MULTIMODAL_MODELS}"
                 )
@@ -573,20 +601,8 @@ class LLM:
                 raise TokenLimitExceeded(self.get_limit_error_message(input_tokens))
 
             # Set up API parameters
-            params = {
-                "model": self.model,
-                "messages": all_messages,
-                "stream": stream,
-            }
-
-            # Add model-specific parameters
-            if self.model in REASONING_MODELS:
-                params["max_completion_tokens"] = self.max_tokens
-            else:
-                params["max_tokens"] = self.max_tokens
-                params["temperature"] = (
-                    temperature if temperature is not None else self.temperature
-                )
+            params = self._request_params(all_messages, temperature)
+            params["stream"] = stream
 
             # Handle non-streaming request
             if not stream:
@@ -623,12 +639,7 @@ class LLM:
             raise
         except OpenAIError as oe:
             logger.error(f"OpenAI API error: {oe}")
-            if isinstance(oe, AuthenticationError):
-                logger.error("Authentication failed. Check API key.")
-            elif isinstance(oe, RateLimitError):
-                logger.error("Rate limit exceeded. Consider increasing retry attempts.")
-            elif isinstance(oe, APIError):
-                logger.error(f"API error: {oe}")
+            _log_openai_error_hint(oe)
             raise
         except Exception as e:
             logger.error(f"Unexpected error in ask_with_images: {e}")
@@ -678,7 +689,7 @@ class LLM:
                 raise ValueError(f"Invalid tool_choice: {tool_choice}")
 
             # Check if the model supports images
-            supports_images = self.model in MULTIMODAL_MODELS
+            supports_images = self.supports_images
 
             # Format messages
             if system_msgs:
@@ -687,22 +698,25 @@ class LLM:
             else:
                 messages = self.format_messages(messages, supports_images)
 
-            # Calculate input token count
-            input_tokens = self.count_message_tokens(messages)
+            # The local estimate only feeds the limit check (usage comes from the
+            # response), so skip tokenizing the request when no limit is set
+            if self.max_input_tokens is not None:
+                # Calculate input token count
+                input_tokens = self.count_message_tokens(messages)
 
-            # If there are tools, calculate token count for tool descriptions
-            tools_tokens = 0
-            if tools:
-                for tool in tools:
-                    tools_tokens += self.count_tokens(str(tool))
+                # If there are tools, calculate token count for tool descriptions
+                tools_tokens = 0
+                if tools:
+                    for tool in tools:
+                        tools_tokens += self._count_tool_tokens(str(tool))
 
-            input_tokens += tools_tokens
+                input_tokens += tools_tokens
 
-            # Check if token limits are exceeded
-            if not self.check_token_limit(input_tokens):
-                error_message = self.get_limit_error_message(input_tokens)
-                # Raise a special exception that won't be retried
-                raise TokenLimitExceeded(error_message)
+                # Check if token limits are exceeded
+                if not self.check_token_limit(input_tokens):
+                    error_message = self.get_limit_error_message(input_tokens)
+                    # Raise a special exception that won't be retried
+                    raise TokenLimitExceeded(error_message)
 
             # Validate tools if provided
             if tools:
@@ -719,14 +733,8 @@ class LLM:
                 "timeout": timeout,
                 **kwargs,
             }
-
-            if self.model in REASONING_MODELS:
-                params["max_completion_tokens"] = self.max_tokens
-            else:
-                params["max_tokens"] = self.max_tokens
-                params["temperature"] = (
-                    temperature if temperature is not None else self.temperature
-                )
+            # The configured token limit and temperature win over caller kwargs
+            params.update(self._sampling_params(temperature))
 
             params["stream"] = False  # Always use non-streaming for tool requests
             response: ChatCompletion = await self.client.chat.completions.create(
@@ -754,12 +762,7 @@ class LLM:
             raise
         except OpenAIError as oe:
             logger.error(f"OpenAI API error: {oe}")
-            if isinstance(oe, AuthenticationError):
-                logger.error("Authentication failed. Check API key.")
-            elif isinstance(oe, RateLimitError):
-                logger.error("Rate limit exceeded. Consider increasing retry attempts.")
-            elif isinstance(oe, APIError):
-                logger.error(f"API error: {oe}")
+            _log_openai_error_hint(oe)
             raise
         except Exception as e:
             logger.error(f"Unexpected error in ask_tool: {e}")
@@ -22,7 +22,10 @@ def define_log_level(print_level="INFO", logfile_level="DEBUG", name: str = None
 
     _logger.remove()
     _logger.add(sys.stderr, level=print_level)
-    _logger.add(PROJECT_ROOT / f"logs/{log_name}.log", level=logfile_level)
+    # Write the log file from a background worker so callers never block on disk IO
+    _logger.add(
+        PROJECT_ROOT / f"logs/{log_name}.log", level=logfile_level, enqueue=True
+    )
     return _logger
 
 
@@ -8,6 +8,7 @@ import argparse
 import asyncio
 import atexit
 import json
+import reprlib
 from inspect import Parameter, Signature
 from typing import Any, Dict, Optional
 
@@ -21,6 +22,25 @@ from app.tool.str_replace_editor import StrReplaceEditor
 from app.tool.terminate import Terminate
 
 
+# Bounded repr for log lines, so large tool arguments are never rendered in full
+_LOG_REPR = reprlib.Repr()
+_LOG_REPR.maxstring = 200
+_LOG_REPR.maxother = 200
+
+# Longest tool result text written to the log
+_LOG_RESULT_CHARS = 200
+
+# Python annotations for JSON Schema parameter types; anything else maps to Any
+_JSON_SCHEMA_TYPES: Dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
+
 class MCPServer:
     """MCP Server implementation with tool registration and management."""
 
@@ -42,14 +62,19 @@ class MCPServer:
 
         # Define the async function to be registered
         async def tool_method(**kwargs):
-            logger.info(f"Executing {tool_name}: {kwargs}")
+            logger.info(f"Executing {tool_name}: {_LOG_REPR.repr(kwargs)}")
             result = await tool.execute(**kwargs)
 
-            logger.info(f"Result of {tool_name}: {result}")
+            # str(ToolResult) returns its existing output text, so only the
+            # logged prefix is copied
+            result_text = str(result)
+            if len(result_text) > _LOG_RESULT_CHARS:
+                result_text = result_text[:_LOG_RESULT_CHARS] + "..."
+            logger.info(f"Result of {tool_name}: {result_text}")
 
             # Handle different types of results (match original logic)
-            if hasattr(result, "model_dump"):
-                return json.dumps(result.model_dump())
+            if hasattr(result, "model_dump_json"):
+                return result.model_dump_json()
             elif isinstance(result, dict):
                 return json.dumps(result)
             return result
@@ -110,19 +135,7 @@ class MCPServer:
             default = Parameter.empty if param_name in required_params else None
 
             # Map JSON Schema types to Python types (same as original)
-            annotation = Any
-            if param_type == "string":
-                annotation = str
-            elif param_type == "integer":
-                annotation = int
-            elif param_type == "number":
-                annotation = float
-            elif param_type == "boolean":
-                annotation = bool
-            elif param_type == "object":
-                annotation = dict
-            elif param_type == "array":
-                annotation = list
+            annotation = _JSON_SCHEMA_TYPES.get(param_type, Any)
 
             # Create parameter with same structure as original
             param = Parameter(
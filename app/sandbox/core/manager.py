@@ -1,7 +1,7 @@
 import asyncio
 import uuid
 from contextlib import asynccontextmanager
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import docker
 from docker.errors import APIError, ImageNotFound
@@ -11,6 +11,11 @@ from app.logger import logger
 from app.sandbox.core.sandbox import DockerSandbox
 
 
+# Backoff between attempts to refill the warm pool after a failure, in seconds
+_REFILL_RETRY_DELAY = 1.0
+_REFILL_MAX_RETRY_DELAY = 60.0
+
+
 class SandboxManager:
     """Docker sandbox manager.
 
@@ -22,8 +27,11 @@ class SandboxManager:
         max_sandboxes: Maximum allowed number of sandboxes.
         idle_timeout: Sandbox idle timeout in seconds.
         cleanup_interval: Cleanup check interval in seconds.
+        warm_pool_size: Number of default sandboxes kept started ahead of use.
         _sandboxes: Active sandbox instance mapping.
         _last_used: Last used time record for sandboxes.
+        _warm_pool: Started default sandboxes not yet handed out, each with
+            the time it joined the pool.
     """
 
     def __init__(
@@ -31,6 +39,7 @@ class SandboxManager:
         max_sandboxes: int = 100,
         idle_timeout: int = 3600,
         cleanup_interval: int = 300,
+        warm_pool_size: int = 0,
     ):
         """Initializes sandbox manager.
 
@@ -38,10 +47,12 @@ class SandboxManager:
             max_sandboxes: Maximum sandbox count limit.
             idle_timeout: Idle timeout in seconds.
             cleanup_interval: Cleanup check interval in seconds.
+            warm_pool_size: Default sandboxes to pre-start; 0 disables the pool.
         """
         self.max_sandboxes = max_sandboxes
         self.idle_timeout = idle_timeout
         self.cleanup_interval = cleanup_interval
+        self.warm_pool_size = warm_pool_size
 
         # Docker client
         self._client = docker.from_env()
@@ -49,18 +60,24 @@ class SandboxManager:
         # Resource mappings
         self._sandboxes: Dict[str, DockerSandbox] = {}
         self._last_used: Dict[str, float] = {}
+        self._warm_pool: List[Tuple[DockerSandbox, float]] = []
+        self._pending_refills = 0
 
         # Concurrency control
         self._locks: Dict[str, asyncio.Lock] = {}
         self._global_lock = asyncio.Lock()
         self._active_operations: Set[str] = set()
+        self._operation_done: Dict[str, asyncio.Event] = {}
 
-        # Cleanup task
+        # Background tasks
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._refill_task: Optional[asyncio.Task] = None
+        self._discard_tasks: Set[asyncio.Task] = set()
         self._is_shutting_down = False
 
-        # Start automatic cleanup
+        # Start automatic cleanup and fill the warm pool
         self.start_cleanup_task()
+        self._schedule_refill()
 
     async def ensure_image(self, image: str) -> bool:
         """Ensures Docker image is available.
@@ -97,6 +114,10 @@ class SandboxManager:
         Raises:
             KeyError: If sandbox not found.
         """
+        # Reject unknown IDs before allocating a lock that would never be released
+        if sandbox_id not in self._sandboxes:
+            raise KeyError(f"Sandbox {sandbox_id} not found")
+
         if sandbox_id not in self._locks:
             self._locks[sandbox_id] = asyncio.Lock()
 
@@ -105,11 +126,14 @@ class SandboxManager:
                 raise KeyError(f"Sandbox {sandbox_id} not found")
 
             self._active_operations.add(sandbox_id)
+            self._operation_done[sandbox_id] = asyncio.Event()
             try:
                 self._last_used[sandbox_id] = asyncio.get_event_loop().time()
                 yield self._sandboxes[sandbox_id]
             finally:
                 self._active_operations.remove(sandbox_id)
+                # Wake any deletion waiting on this operation
+                self._operation_done.pop(sandbox_id).set()
 
     async def create_sandbox(
         self,
@@ -128,11 +152,27 @@ class SandboxManager:
         Raises:
             RuntimeError: If max sandbox count reached or creation fails.
         """
+        is_default = config is None and not volume_bindings
         async with self._global_lock:
-            if len(self._sandboxes) >= self.max_sandboxes:
-                raise RuntimeError(
-                    f"Maximum number of sandboxes ({self.max_sandboxes}) reached"
-                )
+            # Hand out a pre-started sandbox when the default setup was requested
+            if is_default and self._warm_pool:
+                sandbox_id = str(uuid.uuid4())
+                self._sandboxes[sandbox_id], _ = self._warm_pool.pop()
+                self._last_used[sandbox_id] = asyncio.get_event_loop().time()
+                self._locks[sandbox_id] = asyncio.Lock()
+                self._schedule_refill()
+
+                logger.info(f"Created sandbox {sandbox_id} from warm pool")
+                return sandbox_id
+
+            if self._sandbox_count() >= self.max_sandboxes:
+                if not self._warm_pool:
+                    raise RuntimeError(
+                        f"Maximum number of sandboxes ({self.max_sandboxes}) reached"
+                    )
+                # Give up the oldest pooled sandbox to make room for this one
+                pooled, _ = self._warm_pool.pop(0)
+                await pooled.cleanup()
 
             config = config or SandboxSettings()
             if not await self.ensure_image(config.image):
@@ -148,6 +188,9 @@ class SandboxManager:
                 self._locks[sandbox_id] = asyncio.Lock()
 
                 logger.info(f"Created sandbox {sandbox_id}")
+                if is_default:
+                    # The pool ran dry; start refilling it for the next request
+                    self._schedule_refill()
                 return sandbox_id
 
             except Exception as e:
@@ -171,6 +214,121 @@ class SandboxManager:
         async with self.sandbox_operation(sandbox_id) as sandbox:
             return sandbox
 
+    def _sandbox_count(self) -> int:
+        """Counts active, pooled and currently starting pooled sandboxes."""
+        return len(self._sandboxes) + len(self._warm_pool) + self._pending_refills
+
+    def _schedule_refill(self) -> None:
+        """Starts topping up the warm pool unless a refill is already running."""
+        if (
+            self.warm_pool_size <= 0
+            or self._is_shutting_down
+            or (self._refill_task and not self._refill_task.done())
+        ):
+            return
+        self._refill_task = asyncio.create_task(self._refill_warm_pool())
+
+    async def _refill_warm_pool(self) -> None:
+        """Starts default sandboxes until the warm pool is full.
+
+        A failed attempt is retried with exponential backoff, so a transient
+        Docker error does not leave the pool empty for good.
+        """
+        config = SandboxSettings()
+        delay = _REFILL_RETRY_DELAY
+        while True:
+            try:
+                await self._fill_warm_pool(config)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Failed to refill sandbox warm pool, retrying in {delay:.0f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _REFILL_MAX_RETRY_DELAY)
+
+    async def _fill_warm_pool(self, config: SandboxSettings) -> None:
+        """Starts sandboxes until the pool is full or capacity runs out.
+
+        Each slot is reserved under the global lock before its sandbox is
+        started, so pooled, starting and active sandboxes together never
+        exceed max_sandboxes.
+
+        Args:
+            config: Sandbox configuration for pooled sandboxes.
+
+        Raises:
+            RuntimeError: If the sandbox image is unavailable.
+        """
+        if not await self.ensure_image(config.image):
+            raise RuntimeError(f"Failed to ensure Docker image: {config.image}")
+
+        while True:
+            async with self._global_lock:
+                if (
+                    self._is_shutting_down
+                    or len(self._warm_pool) + self._pending_refills
+                    >= self.warm_pool_size
+                    or self._sandbox_count() >= self.max_sandboxes
+                ):
+                    return
+                self._pending_refills += 1
+
+            try:
+                sandbox = await self._start_pooled_sandbox(config)
+            finally:
+                self._pending_refills -= 1
+
+            if self._is_shutting_down:
+                await sandbox.cleanup()
+                return
+            self._warm_pool.append((sandbox, asyncio.get_event_loop().time()))
+
+    async def _start_pooled_sandbox(self, config: SandboxSettings) -> DockerSandbox:
+        """Creates and starts a sandbox for the warm pool.
+
+        Args:
+            config: Sandbox configuration.
+
+        Returns:
+            DockerSandbox: Started sandbox.
+        """
+        sandbox = DockerSandbox(config)
+        creating = asyncio.ensure_future(sandbox.create())
+        try:
+            await asyncio.shield(creating)
+        except asyncio.CancelledError:
+            # Cancelling create() midway leaves sandbox.container unset while the
+            # container keeps starting, so let it finish before removing it
+            # Tracked so cleanup() can wait for it even if this task is cancelled
+            discard = asyncio.ensure_future(
+                self._discard_after_create(creating, sandbox)
+            )
+            self._discard_tasks.add(discard)
+            discard.add_done_callback(self._discard_tasks.discard)
+            await asyncio.shield(discard)
+            raise
+        return sandbox
+
+    @staticmethod
+    async def _discard_after_create(
+        creating: asyncio.Future, sandbox: DockerSandbox
+    ) -> None:
+        """Waits for a sandbox creation to finish, then removes the sandbox.
+
+        Args:
+            creating: Pending sandbox creation.
+            sandbox: Sandbox being created.
+        """
+        try:
+            await creating
+        except Exception:
+            # create() already cleaned up after a failed start
+            pass
+        await sandbox.cleanup()
+
     def start_cleanup_task(self) -> None:
         """Starts automatic cleanup task."""
 
@@ -197,24 +355,57 @@ class SandboxManager:
                 ):
                     to_cleanup.append(sandbox_id)
 
-        for sandbox_id in to_cleanup:
-            try:
-                await self.delete_sandbox(sandbox_id)
-            except Exception as e:
-                logger.error(f"Error cleaning up sandbox {sandbox_id}: {e}")
+            # Pooled sandboxes are replaced once they have waited too long
+            stale = [
+                sandbox
+                for sandbox, pooled_at in self._warm_pool
+                if current_time - pooled_at > self.idle_timeout
+            ]
+            if stale:
+                self._warm_pool = [
+                    entry
+                    for entry in self._warm_pool
+                    if current_time - entry[1] <= self.idle_timeout
+                ]
+
+        if stale:
+            await asyncio.gather(
+                *(sandbox.cleanup() for sandbox in stale), return_exceptions=True
+            )
+            self._schedule_refill()
+
+        # Delete idle sandboxes concurrently instead of one round-trip at a time
+        results = await asyncio.gather(
+            *(self.delete_sandbox(sandbox_id) for sandbox_id in to_cleanup),
+            return_exceptions=True,
+        )
+        for sandbox_id, result in zip(to_cleanup, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error cleaning up sandbox {sandbox_id}: {result}")
 
     async def cleanup(self) -> None:
         """Cleans up all resources."""
         logger.info("Starting manager cleanup...")
         self._is_shutting_down = True
 
-        # Cancel cleanup task
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await asyncio.wait_for(self._cleanup_task, timeout=1.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                pass
+        # Cancel background tasks
+        for task in (self._cleanup_task, self._refill_task):
+            if task:
+                task.cancel()
+                try:
+                    await asyncio.wait_for(task, timeout=1.0)
+                except (asyncio.CancelledError, asyncio.TimeoutError):
+                    pass
+
+        # Let interrupted pool starts finish removing their containers
+        if self._discard_tasks:
+            await asyncio.gather(*self._discard_tasks, return_exceptions=True)
+
+        # Remove pre-started sandboxes that were never handed out
+        warm_pool, self._warm_pool = self._warm_pool, []
+        await asyncio.gather(
+            *(sandbox.cleanup() for sandbox, _ in warm_pool), return_exceptions=True
+        )
 
         # Get all sandbox IDs to clean up
         async with self._global_lock:
@@ -238,6 +429,7 @@ class SandboxManager:
         self._last_used.clear()
         self._locks.clear()
         self._active_operations.clear()
+        self._operation_done.clear()
 
         logger.info("Manager cleanup completed")
 
@@ -248,15 +440,14 @@ class SandboxManager:
             sandbox_id: Sandbox ID to delete.
         """
         try:
-            if sandbox_id in self._active_operations:
+            operation_done = self._operation_done.get(sandbox_id)
+            if operation_done is not None:
                 logger.warning(
                     f"Sandbox {sandbox_id} has active operations, waiting for completion"
                 )
-                for _ in range(10):  # Wait at most 10 times
-                    await asyncio.sleep(0.5)
-                    if sandbox_id not in self._active_operations:
-                        break
-                else:
+                try:
+                    await asyncio.wait_for(operation_done.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
                     logger.warning(
                         f"Timeout waiting for sandbox {sandbox_id} operations to complete"
                     )
@@ -272,6 +463,9 @@ class SandboxManager:
                     self._last_used.pop(sandbox_id, None)
                     self._locks.pop(sandbox_id, None)
                     logger.info(f"Deleted sandbox {sandbox_id}")
+
+                # The freed slot may let the warm pool grow back
+                self._schedule_refill()
         except Exception as e:
             logger.error(f"Error during cleanup of sandbox {sandbox_id}: {e}")
 
@@ -305,6 +499,7 @@ class SandboxManager:
         """
         return {
             "total_sandboxes": len(self._sandboxes),
+            "warm_sandboxes": len(self._warm_pool),
             "active_operations": len(self._active_operations),
             "max_sandboxes": self.max_sandboxes,
             "idle_timeout": self.idle_timeout,
@@ -1,10 +1,11 @@
 import asyncio
 import io
 import os
+import shutil
 import tarfile
 import tempfile
 import uuid
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 
 import docker
 from docker.errors import NotFound
@@ -15,6 +16,39 @@ from app.sandbox.core.exceptions import SandboxTimeoutError
 from app.sandbox.core.terminal import AsyncDockerizedTerminal
 
 
+# Buffer size for copying file contents out of a container archive
+_COPY_CHUNK_SIZE = 64 * 1024
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks.
+
+    Lets tarfile consume a Docker archive stream incrementally instead of
+    requiring the whole archive to be buffered first.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._chunk = b""
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._offset >= len(self._chunk):
+            try:
+                self._chunk = next(self._chunks)
+            except StopIteration:
+                return 0
+            self._offset = 0
+
+        size = min(len(buffer), len(self._chunk) - self._offset)
+        buffer[:size] = self._chunk[self._offset : self._offset + size]
+        self._offset += size
+        return size
+
+
 class DockerSandbox:
     """Docker sandbox environment.
 
@@ -82,14 +116,16 @@ class DockerSandbox:
                 detach=True,
             )
 
-            self.container = self.client.containers.get(container["Id"])
+            # Wrap the create response directly rather than inspecting the new
+            # container again; only its ID is used afterwards
+            self.container = self.client.containers.prepare_model(container)
 
             # Start container
             await asyncio.to_thread(self.container.start)
 
             # Initialize terminal
             self.terminal = AsyncDockerizedTerminal(
-                container["Id"],
+                self.container,
                 self.config.work_dir,
                 env_vars={"PYTHONUNBUFFERED": "1"}
                 # Ensure Python output is not buffered
@@ -210,21 +246,16 @@ class DockerSandbox:
 
         try:
             resolved_path = self._safe_resolve_path(path)
-            parent_dir = os.path.dirname(resolved_path)
 
-            # Create parent directory
-            if parent_dir:
-                await self.run_command(f"mkdir -p {parent_dir}")
-
-            # Prepare file data
+            # Name the member by its full path and extract at the root: Docker
+            # creates missing parent directories while unpacking, so no separate
+            # mkdir round-trip through the shell is needed
             tar_stream = await self._create_tar_stream(
-                os.path.basename(path), content.encode("utf-8")
+                resolved_path.lstrip("/"), content.encode("utf-8")
             )
 
             # Write file
-            await asyncio.to_thread(
-                self.container.put_archive, parent_dir or "/", tar_stream
-            )
+            await asyncio.to_thread(self.container.put_archive, "/", tar_stream)
 
         except Exception as e:
             raise RuntimeError(f"Failed to write file: {e}")
@@ -271,41 +302,39 @@ class DockerSandbox:
 
             # Get file stream
             resolved_src = self._safe_resolve_path(src_path)
-            stream, stat = await asyncio.to_thread(
+            stream, _ = await asyncio.to_thread(
                 self.container.get_archive, resolved_src
             )
 
-            # Create temporary directory to extract file
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                # Write stream to temporary file
-                tar_path = os.path.join(tmp_dir, "temp.tar")
-                with open(tar_path, "wb") as f:
-                    for chunk in stream:
-                        f.write(chunk)
-
-                # Extract file
-                with tarfile.open(tar_path) as tar:
-                    members = tar.getmembers()
-                    if not members:
+            def extract() -> None:
+                # Unpack straight off the archive stream instead of spooling the
+                # whole tar to a temporary file and reopening it
+                with tarfile.open(fileobj=_ChunkReader(stream), mode="r|") as tar:
+                    member = tar.next()
+                    if member is None:
                         raise FileNotFoundError(f"Source file is empty: {src_path}")
 
                     # If destination is a directory, we should preserve relative path structure
                     if os.path.isdir(dst_path):
-                        tar.extractall(dst_path)
-                    else:
-                        # If destination is a file, we only extract the source file's content
-                        if len(members) > 1:
-                            raise RuntimeError(
-                                f"Source path is a directory but destination is a file: {src_path}"
-                            )
-
-                        with open(dst_path, "wb") as dst:
-                            src_file = tar.extractfile(members[0])
-                            if src_file is None:
-                                raise RuntimeError(
-                                    f"Failed to extract file: {src_path}"
-                                )
-                            dst.write(src_file.read())
+                        while member is not None:
+                            tar.extract(member, dst_path)
+                            member = tar.next()
+                        return
+
+                    # If destination is a file, we only extract the source file's content
+                    if member.isdir():
+                        raise RuntimeError(
+                            f"Source path is a directory but destination is a file: {src_path}"
+                        )
+
+                    src_file = tar.extractfile(member)
+                    if src_file is None:
+                        raise RuntimeError(f"Failed to extract file: {src_path}")
+
+                    with open(dst_path, "wb") as dst:
+                        shutil.copyfileobj(src_file, dst, _COPY_CHUNK_SIZE)
+
+            await asyncio.to_thread(extract)
 
         except docker.errors.NotFound:
             raise FileNotFoundError(f"Source file not found: {src_path}")
@@ -327,11 +356,10 @@ class DockerSandbox:
             if not os.path.exists(src_path):
                 raise FileNotFoundError(f"Source file not found: {src_path}")
 
-            # Create destination directory in container
+            # Members are named by their full container path and extracted at
+            # the root, so Docker creates any missing parent directories itself
             resolved_dst = self._safe_resolve_path(dst_path)
-            container_dir = os.path.dirname(resolved_dst)
-            if container_dir:
-                await self.run_command(f"mkdir -p {container_dir}")
+            dst_name = resolved_dst.lstrip("/")
 
             # Create tar file to upload
             with tempfile.TemporaryDirectory() as tmp_dir:
@@ -339,35 +367,23 @@ class DockerSandbox:
                 with tarfile.open(tar_path, "w") as tar:
                     # Handle directory source path
                     if os.path.isdir(src_path):
-                        os.path.basename(src_path.rstrip("/"))
                         for root, _, files in os.walk(src_path):
                             for file in files:
                                 file_path = os.path.join(root, file)
                                 arcname = os.path.join(
-                                    os.path.basename(dst_path),
-                                    os.path.relpath(file_path, src_path),
+                                    dst_name, os.path.relpath(file_path, src_path)
                                 )
                                 tar.add(file_path, arcname=arcname)
                     else:
                         # Add single file to tar
-                        tar.add(src_path, arcname=os.path.basename(dst_path))
+                        tar.add(src_path, arcname=dst_name)
 
                 # Read tar file content
                 with open(tar_path, "rb") as f:
                     data = f.read()
 
-                # Upload to container
-                await asyncio.to_thread(
-                    self.container.put_archive,
-                    os.path.dirname(resolved_dst) or "/",
-                    data,
-                )
-
-                # Verify file was created successfully
-                try:
-                    await self.run_command(f"test -e {resolved_dst}")
-                except Exception:
-                    raise RuntimeError(f"Failed to verify file creation: {dst_path}")
+                # Upload to container; put_archive raises if the daemon rejects it
+                await asyncio.to_thread(self.container.put_archive, "/", data)
 
         except FileNotFoundError:
             raise
@@ -406,12 +422,11 @@ class DockerSandbox:
         Raises:
             RuntimeError: If read operation fails.
         """
-        with tempfile.NamedTemporaryFile() as tmp:
-            for chunk in tar_stream:
-                tmp.write(chunk)
-            tmp.seek(0)
 
-            with tarfile.open(fileobj=tmp) as tar:
+        def extract() -> bytes:
+            # Stream mode reads the archive straight off the chunk iterator,
+            # so the tar never has to be spooled to disk first.
+            with tarfile.open(fileobj=_ChunkReader(tar_stream), mode="r|") as tar:
                 member = tar.next()
                 if not member:
                     raise RuntimeError("Empty tar archive")
@@ -422,6 +437,8 @@ class DockerSandbox:
 
                 return file_content.read()
 
+        return await asyncio.to_thread(extract)
+
     async def cleanup(self) -> None:
         """Cleans up sandbox resources."""
         errors = []
@@ -436,11 +453,7 @@ class DockerSandbox:
 
             if self.container:
                 try:
-                    await asyncio.to_thread(self.container.stop, timeout=5)
-                except Exception as e:
-                    errors.append(f"Container stop error: {e}")
-
-                try:
+                    # A forced remove kills and deletes the container in one request
                     await asyncio.to_thread(self.container.remove, force=True)
                 except Exception as e:
                     errors.append(f"Container remove error: {e}")
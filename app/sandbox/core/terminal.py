@@ -16,14 +16,30 @@ from docker.errors import APIError
 from docker.models.containers import Container
 
 
+# Trailing exit-status echo left in the captured output of a command
+_TRAILING_ECHO_PATTERN = re.compile(r"\n\$ echo \$\$?.*$")
+
+
 class DockerSession:
-    def __init__(self, container_id: str) -> None:
+    # Command fragments rejected by _sanitize_command
+    _RISKY_COMMANDS = (
+        "rm -rf /",
+        "rm -rf /*",
+        "mkfs",
+        "dd if=/dev/zero",
+        ":(){:|:&};:",
+        "chmod -R 777 /",
+        "chown -R",
+    )
+
+    def __init__(self, container_id: str, api: Optional[APIClient] = None) -> None:
         """Initializes a Docker session.
 
         Args:
             container_id: ID of the Docker container.
+            api: Docker API client to reuse. A new client is created if None.
         """
-        self.api = APIClient()
+        self.api = api or APIClient()
         self.container_id = container_id
         self.exec_id = None
         self.socket = None
@@ -77,15 +93,14 @@ class DockerSession:
 
         1. Sends exit command
         2. Closes socket connection
-        3. Checks and cleans up exec instance
+        3. Drops the exec instance reference
         """
         try:
             if self.socket:
                 # Send exit command to close bash session
                 try:
+                    # Queued ahead of the shutdown below, so no need to wait for it
                     self.socket.sendall(b"exit\n")
-                    # Allow time for command execution
-                    await asyncio.sleep(0.1)
                 except:
                     pass  # Ignore sending errors, continue cleanup
 
@@ -98,17 +113,9 @@ class DockerSession:
                 self.socket.close()
                 self.socket = None
 
-            if self.exec_id:
-                try:
-                    # Check exec instance status
-                    exec_inspect = self.api.exec_inspect(self.exec_id)
-                    if exec_inspect.get("Running", False):
-                        # If still running, wait for it to complete
-                        await asyncio.sleep(0.5)
-                except:
-                    pass  # Ignore inspection errors, continue cleanup
-
-                self.exec_id = None
+            # The shell exits on "exit" or on EOF from the closed socket, so there
+            # is nothing to wait for on the exec instance
+            self.exec_id = None
 
         except Exception as e:
             # Log error but don't raise, ensure cleanup continues
@@ -125,17 +132,25 @@ class DockerSession:
         """
         buffer = b""
         while b"$ " not in buffer:
-            try:
-                chunk = self.socket.recv(4096)
-                if chunk:
-                    buffer += chunk
-            except socket.error as e:
-                if e.errno == socket.EWOULDBLOCK:
-                    await asyncio.sleep(0.1)
-                    continue
-                raise
+            chunk = await self._recv()
+            if not chunk:
+                raise ConnectionError("Session closed before prompt was received")
+            buffer += chunk
         return buffer.decode("utf-8")
 
+    async def _recv(self) -> bytes:
+        """Receives the next chunk of output from the session.
+
+        Waits for the socket to become readable instead of polling it.
+
+        Returns:
+            Received bytes, empty if the connection was closed.
+
+        Raises:
+            socket.error: If socket communication fails.
+        """
+        return await asyncio.get_running_loop().sock_recv(self.socket, 4096)
+
     async def execute(self, command: str, timeout: Optional[int] = None) -> str:
         """Executes a command and returns cleaned output.
 
@@ -163,43 +178,38 @@ class DockerSession:
                 buffer = b""
                 result_lines = []
                 command_sent = False
+                recv = self._recv
 
                 while True:
-                    try:
-                        chunk = self.socket.recv(4096)
-                        if not chunk:
-                            break
-
-                        buffer += chunk
-                        lines = buffer.split(b"\n")
+                    chunk = await recv()
+                    if not chunk:
+                        break
 
-                        buffer = lines[-1]
-                        lines = lines[:-1]
+                    buffer += chunk
+                    lines = buffer.split(b"\n")
 
-                        for line in lines:
-                            line = line.rstrip(b"\r")
+                    buffer = lines[-1]
+                    lines = lines[:-1]
 
-                            if not command_sent:
-                                command_sent = True
-                                continue
+                    for line in lines:
+                        line = line.rstrip(b"\r")
 
-                            if line.strip() == b"echo $?" or line.strip().isdigit():
-                                continue
+                        if not command_sent:
+                            command_sent = True
+                            continue
 
-                            if line.strip():
-                                result_lines.append(line)
+                        stripped = line.strip()
+                        if stripped == b"echo $?" or stripped.isdigit():
+                            continue
 
-                        if buffer.endswith(b"$ "):
-                            break
+                        if stripped:
+                            result_lines.append(line)
 
-                    except socket.error as e:
-                        if e.errno == socket.EWOULDBLOCK:
-                            await asyncio.sleep(0.1)
-                            continue
-                        raise
+                    if buffer.endswith(b"$ "):
+                        break
 
                 output = b"\n".join(result_lines).decode("utf-8")
-                output = re.sub(r"\n\$ echo \$\$?.*$", "", output)
+                output = _TRAILING_ECHO_PATTERN.sub("", output)
 
                 return output
 
@@ -227,20 +237,10 @@ class DockerSession:
         Raises:
             ValueError: If command contains potentially dangerous patterns.
         """
-
         # Additional checks for specific risky commands
-        risky_commands = [
-            "rm -rf /",
-            "rm -rf /*",
-            "mkfs",
-            "dd if=/dev/zero",
-            ":(){:|:&};:",
-            "chmod -R 777 /",
-            "chown -R",
-        ]
-
-        for risky in risky_commands:
-            if risky in command.lower():
+        lowered = command.lower()
+        for risky in self._RISKY_COMMANDS:
+            if risky in lowered:
                 raise ValueError(
                     f"Command contains potentially dangerous operation: {risky}"
                 )
@@ -264,12 +264,13 @@ class AsyncDockerizedTerminal:
             env_vars: Environment variables to set.
             default_timeout: Default command execution timeout in seconds.
         """
-        self.client = docker.from_env()
-        self.container = (
-            container
-            if isinstance(container, Container)
-            else self.client.containers.get(container)
-        )
+        if isinstance(container, Container):
+            # Reuse the client the container was loaded with
+            self.client = container.client
+        else:
+            self.client = docker.from_env()
+            container = self.client.containers.get(container)
+        self.container = container
         self.working_dir = working_dir
         self.env_vars = env_vars or {}
         self.default_timeout = default_timeout
@@ -285,7 +286,7 @@ class AsyncDockerizedTerminal:
         """
         await self._ensure_workdir()
 
-        self.session = DockerSession(self.container.id)
+        self.session = DockerSession(self.container.id, self.client.api)
         await self.session.create(self.working_dir, self.env_vars)
 
     async def _ensure_workdir(self) -> None:
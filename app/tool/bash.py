@@ -78,19 +78,24 @@ class _BashSession:
         await self._process.stdin.drain()
 
         # read output from the process, until the sentinel is found
+        sentinel = self._sentinel.encode()
+        searched = 0
         try:
             async with asyncio.timeout(self._timeout):
                 while True:
                     await asyncio.sleep(self._output_delay)
                     # if we read directly from stdout/stderr, it will wait forever for
                     # EOF. use the StreamReader buffer directly instead.
-                    output = (
-                        self._process.stdout._buffer.decode()
+                    buffer = (
+                        self._process.stdout._buffer
                     )  # pyright: ignore[reportAttributeAccessIssue]
-                    if self._sentinel in output:
+                    # only scan the bytes that arrived since the previous poll
+                    index = buffer.find(sentinel, max(searched - len(sentinel) + 1, 0))
+                    if index != -1:
                         # strip the sentinel and break
-                        output = output[: output.index(self._sentinel)]
+                        output = buffer[:index].decode()
                         break
+                    searched = len(buffer)
         except asyncio.TimeoutError:
             self._timed_out = True
             raise ToolError(
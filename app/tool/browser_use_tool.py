@@ -1,8 +1,9 @@
 import asyncio
 import base64
 import json
-from typing import Generic, Optional, TypeVar
+from typing import Generic, Optional, Tuple, TypeVar
 
+import markdownify
 from browser_use import Browser as BrowserUseBrowser
 from browser_use import BrowserConfig
 from browser_use.browser.context import BrowserContext, BrowserContextConfig
@@ -379,8 +380,6 @@ class BrowserUseTool(BaseTool, Generic[Context]):
                         )
 
                     page = await context.get_current_page()
-                    import markdownify
-
                     content = markdownify.markdownify(await page.content())
 
                     prompt = f"""\
@@ -484,52 +483,10 @@ Page content:
         If context is not provided, uses self.context.
         """
         try:
-            # Use provided context or fall back to self.context
-            ctx = context or self.context
-            if not ctx:
+            if not (context or self.context):
                 return ToolResult(error="Browser context not initialized")
 
-            state = await ctx.get_state()
-
-            # Create a viewport_info dictionary if it doesn't exist
-            viewport_height = 0
-            if hasattr(state, "viewport_info") and state.viewport_info:
-                viewport_height = state.viewport_info.height
-            elif hasattr(ctx, "config") and hasattr(ctx.config, "browser_window_size"):
-                viewport_height = ctx.config.browser_window_size.get("height", 0)
-
-            # Take a screenshot for the state
-            page = await ctx.get_current_page()
-
-            await page.bring_to_front()
-            await page.wait_for_load_state()
-
-            screenshot = await page.screenshot(
-                full_page=True, animations="disabled", type="jpeg", quality=100
-            )
-
-            screenshot = base64.b64encode(screenshot).decode("utf-8")
-
-            # Build the state info with all required fields
-            state_info = {
-                "url": state.url,
-                "title": state.title,
-                "tabs": [tab.model_dump() for tab in state.tabs],
-                "help": "[0], [1], [2], etc., represent clickable indices corresponding to the elements listed. Clicking on these indices will navigate to or interact with the respective content behind them.",
-                "interactive_elements": (
-                    state.element_tree.clickable_elements_to_string()
-                    if state.element_tree
-                    else ""
-                ),
-                "scroll_info": {
-                    "pixels_above": getattr(state, "pixels_above", 0),
-                    "pixels_below": getattr(state, "pixels_below", 0),
-                    "total_height": getattr(state, "pixels_above", 0)
-                    + getattr(state, "pixels_below", 0)
-                    + viewport_height,
-                },
-                "viewport_height": viewport_height,
-            }
+            state_info, screenshot = await self.get_state_dict(context)
 
             return ToolResult(
                 output=json.dumps(state_info, indent=4, ensure_ascii=False),
@@ -538,6 +495,62 @@ Page content:
         except Exception as e:
             return ToolResult(error=f"Failed to get browser state: {str(e)}")
 
+    async def get_state_dict(
+        self, context: Optional[BrowserContext] = None
+    ) -> Tuple[dict, str]:
+        """
+        Get the current browser state as a dict plus a base64 page screenshot.
+        If context is not provided, uses self.context.
+        """
+        # Use provided context or fall back to self.context
+        ctx = context or self.context
+        if not ctx:
+            raise RuntimeError("Browser context not initialized")
+
+        state = await ctx.get_state()
+
+        # Create a viewport_info dictionary if it doesn't exist
+        viewport_height = 0
+        if hasattr(state, "viewport_info") and state.viewport_info:
+            viewport_height = state.viewport_info.height
+        elif hasattr(ctx, "config") and hasattr(ctx.config, "browser_window_size"):
+            viewport_height = ctx.config.browser_window_size.get("height", 0)
+
+        # Take a screenshot for the state
+        page = await ctx.get_current_page()
+
+        await page.bring_to_front()
+        await page.wait_for_load_state()
+
+        screenshot = await page.screenshot(
+            full_page=True, animations="disabled", type="jpeg", quality=100
+        )
+
+        screenshot = base64.b64encode(screenshot).decode("utf-8")
+
+        # Build the state info with all required fields
+        state_info = {
+            "url": state.url,
+            "title": state.title,
+            "tabs": [tab.model_dump() for tab in state.tabs],
+            "help": "[0], [1], [2], etc., represent clickable indices corresponding to the elements listed. Clicking on these indices will navigate to or interact with the respective content behind them.",
+            "interactive_elements": (
+                state.element_tree.clickable_elements_to_string()
+                if state.element_tree
+                else ""
+            ),
+            "scroll_info": {
+                "pixels_above": getattr(state, "pixels_above", 0),
+                "pixels_below": getattr(state, "pixels_below", 0),
+                "total_height": getattr(state, "pixels_above", 0)
+                + getattr(state, "pixels_below", 0)
+                + viewport_height,
+            },
+            "viewport_height": viewport_height,
+        }
+
+        return state_info, screenshot
+
     async def cleanup(self):
         """Clean up browser resources."""
         async with self.lock:
@@ -562,6 +575,4 @@ Page content:
     @classmethod
     def create_with_context(cls, context: Context) -> "BrowserUseTool[Context]":
         """Factory method to create a BrowserUseTool with a specific context."""
-        tool = cls()
-        tool.tool_context = context
-        return tool
+        return cls(tool_context=context)
@@ -1,3 +1,5 @@
+import asyncio
+import re
 from contextlib import AsyncExitStack
 from typing import Dict, List, Optional
 
@@ -11,6 +13,10 @@ from app.tool.base import BaseTool, ToolResult
 from app.tool.tool_collection import ToolCollection
 
 
+_INVALID_TOOL_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+_REPEATED_UNDERSCORES = re.compile(r"_+")
+
+
 class MCPClientTool(BaseTool):
     """Represents a tool proxy that can be called on the MCP server from the client side."""
 
@@ -46,6 +52,7 @@ class MCPClients(ToolCollection):
     def __init__(self):
         super().__init__()  # Initialize with empty tools list
         self.name = "mcp"  # Keep name for backward compatibility
+        self.server_tools: Dict[str, List[str]] = {}  # Tool names per server
 
     async def connect_sse(self, server_url: str, server_id: str = "") -> None:
         """Connect to an MCP server using SSE transport."""
@@ -104,10 +111,11 @@ class MCPClients(ToolCollection):
         response = await session.list_tools()
 
         # Create proper tool objects for each server tool
+        tool_names = self.server_tools.setdefault(server_id, [])
+        name_prefix = f"mcp_{server_id}_"
         for tool in response.tools:
             original_name = tool.name
-            tool_name = f"mcp_{server_id}_{original_name}"
-            tool_name = self._sanitize_tool_name(tool_name)
+            tool_name = self._sanitize_tool_name(name_prefix + original_name)
 
             server_tool = MCPClientTool(
                 name=tool_name,
@@ -118,6 +126,7 @@ class MCPClients(ToolCollection):
                 original_name=original_name,
             )
             self.tool_map[tool_name] = server_tool
+            tool_names.append(tool_name)
 
         # Update tools tuple
         self.tools = tuple(self.tool_map.values())
@@ -127,13 +136,11 @@ class MCPClients(ToolCollection):
 
     def _sanitize_tool_name(self, name: str) -> str:
         """Sanitize tool name to match MCPClientTool requirements."""
-        import re
-
         # Replace invalid characters with underscores
-        sanitized = re.sub(r"[^a-zA-Z0-9_-]", "_", name)
+        sanitized = _INVALID_TOOL_NAME_CHARS.sub("_", name)
 
         # Remove consecutive underscores
-        sanitized = re.sub(r"_+", "_", sanitized)
+        sanitized = _REPEATED_UNDERSCORES.sub("_", sanitized)
 
         # Remove leading/trailing underscores
         sanitized = sanitized.strip("_")
@@ -147,8 +154,11 @@ class MCPClients(ToolCollection):
     async def list_tools(self) -> ListToolsResult:
         """List all available tools."""
         tools_result = ListToolsResult(tools=[])
-        for session in self.sessions.values():
-            response = await session.list_tools()
+        # Query every server at once; gather keeps the results in session order
+        responses = await asyncio.gather(
+            *(session.list_tools() for session in self.sessions.values())
+        )
+        for response in responses:
             tools_result.tools += response.tools
         return tools_result
 
@@ -176,11 +186,10 @@ class MCPClients(ToolCollection):
                     self.exit_stacks.pop(server_id, None)
 
                     # Remove tools associated with this server
-                    self.tool_map = {
-                        k: v
-                        for k, v in self.tool_map.items()
-                        if v.server_id != server_id
-                    }
+                    for tool_name in self.server_tools.pop(server_id, []):
+                        tool = self.tool_map.get(tool_name)
+                        if tool and tool.server_id == server_id:
+                            del self.tool_map[tool_name]
                     self.tools = tuple(self.tool_map.values())
                     logger.info(f"Disconnected from MCP server {server_id}")
                 except Exception as e:
@@ -190,5 +199,6 @@ class MCPClients(ToolCollection):
             for sid in sorted(list(self.sessions.keys())):
                 await self.disconnect(sid)
             self.tool_map = {}
+            self.server_tools = {}
             self.tools = tuple()
             logger.info("Disconnected from all MCP servers")
@@ -1,4 +1,5 @@
 # tool/planning.py
+from collections import Counter
 from typing import Dict, List, Literal, Optional
 
 from app.exceptions import ToolError
@@ -10,6 +11,14 @@ A planning tool that allows the agent to create and manage plans for solving com
 The tool provides functionality for creating plans, updating plan steps, and tracking progress.
 """
 
+# Marker shown next to each step in formatted plans, keyed by step status
+_STATUS_SYMBOLS = {
+    "not_started": "[ ]",
+    "in_progress": "[→]",
+    "completed": "[✓]",
+    "blocked": "[!]",
+}
+
 
 class PlanningTool(BaseTool):
     """
@@ -326,14 +335,11 @@ class PlanningTool(BaseTool):
 
         # Calculate progress statistics
         total_steps = len(plan["steps"])
-        completed = sum(1 for status in plan["step_statuses"] if status == "completed")
-        in_progress = sum(
-            1 for status in plan["step_statuses"] if status == "in_progress"
-        )
-        blocked = sum(1 for status in plan["step_statuses"] if status == "blocked")
-        not_started = sum(
-            1 for status in plan["step_statuses"] if status == "not_started"
-        )
+        status_counts = Counter(plan["step_statuses"])
+        completed = status_counts["completed"]
+        in_progress = status_counts["in_progress"]
+        blocked = status_counts["blocked"]
+        not_started = status_counts["not_started"]
 
         output += f"Progress: {completed}/{total_steps} steps completed "
         if total_steps > 0:
@@ -349,12 +355,7 @@ class PlanningTool(BaseTool):
         for i, (step, status, notes) in enumerate(
             zip(plan["steps"], plan["step_statuses"], plan["step_notes"])
         ):
-            status_symbol = {
-                "not_started": "[ ]",
-                "in_progress": "[→]",
-                "completed": "[✓]",
-                "blocked": "[!]",
-            }.get(status, "[ ]")
+            status_symbol = _STATUS_SYMBOLS.get(status, "[ ]")
 
             output += f"{i}. {status_symbol} {step}\n"
             if notes:
@@ -1,3 +1,4 @@
+import asyncio
 import multiprocessing
 import sys
 from io import StringIO
@@ -62,7 +63,8 @@ class PythonExecute(BaseTool):
                 target=self._run_code, args=(code, result, safe_globals)
             )
             proc.start()
-            proc.join(timeout)
+            # Wait in a worker thread so the event loop keeps running meanwhile
+            await asyncio.to_thread(proc.join, timeout)
 
             # timeout process
             if proc.is_alive():
@@ -124,6 +124,12 @@ class StrReplaceEditor(BaseTool):
         **kwargs: Any,
     ) -> str:
         """Execute a file operation command."""
+        # Reject unknown commands before validate_path touches the file system
+        if command not in get_args(Command):
+            raise ToolError(
+                f'Unrecognized command {command}. The allowed commands for the {self.name} tool are: {", ".join(get_args(Command))}'
+            )
+
         # Get the appropriate file operator
         operator = self._get_operator()
 
@@ -153,13 +159,8 @@ class StrReplaceEditor(BaseTool):
             if new_str is None:
                 raise ToolError("Parameter `new_str` is required for command: insert")
             result = await self.insert(path, insert_line, new_str, operator)
-        elif command == "undo_edit":
+        else:  # undo_edit
             result = await self.undo_edit(path, operator)
-        else:
-            # This should be caught by type checking, but we include it for safety
-            raise ToolError(
-                f'Unrecognized command {command}. The allowed commands for the {self.name} tool are: {", ".join(get_args(Command))}'
-            )
 
         return str(result)
 
@@ -1,5 +1,5 @@
 """Collection classes for managing multiple tools."""
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from app.exceptions import ToolError
 from app.logger import logger
@@ -15,12 +15,18 @@ class ToolCollection:
     def __init__(self, *tools: BaseTool):
         self.tools = tools
         self.tool_map = {tool.name: tool for tool in tools}
+        self._params: Optional[List[Dict[str, Any]]] = None
+        self._params_tools: tuple = ()
 
     def __iter__(self):
         return iter(self.tools)
 
     def to_params(self) -> List[Dict[str, Any]]:
-        return [tool.to_param() for tool in self.tools]
+        # Rebuild only when the tools tuple has been replaced since the last call
+        if self._params is None or self._params_tools is not self.tools:
+            self._params = [tool.to_param() for tool in self.tools]
+            self._params_tools = self.tools
+        return self._params
 
     async def execute(
         self, *, name: str, tool_input: Dict[str, Any] = None
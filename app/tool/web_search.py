@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 import requests
 from bs4 import BeautifulSoup
 from pydantic import BaseModel, ConfigDict, Field, model_validator
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.config import config
@@ -19,6 +20,14 @@ from app.tool.search import (
 from app.tool.search.base import SearchItem
 
 
+# Upper bound on result pages downloaded at the same time
+_MAX_CONCURRENT_FETCHES = 5
+
+# Connection pool shared by page fetches. urllib3 pools are thread-safe while
+# requests.Session is not, so each fetch mounts this on a session of its own.
+_FETCH_ADAPTER = HTTPAdapter(pool_maxsize=_MAX_CONCURRENT_FETCHES)
+
+
 class SearchResult(BaseModel):
     """Represents a single search result returned by a search engine."""
 
@@ -106,6 +115,14 @@ class SearchResponse(ToolResult):
 class WebContentFetcher:
     """Utility class for fetching web content."""
 
+    @staticmethod
+    def _get(url: str, headers: dict, timeout: int) -> requests.Response:
+        """GET a page through the shared connection pool."""
+        session = requests.Session()
+        session.mount("http://", _FETCH_ADAPTER)
+        session.mount("https://", _FETCH_ADAPTER)
+        return session.get(url, headers=headers, timeout=timeout)
+
     @staticmethod
     async def fetch_content(url: str, timeout: int = 10) -> Optional[str]:
         """
@@ -125,7 +142,7 @@ class WebContentFetcher:
         try:
             # Use asyncio to run requests in a thread pool
             response = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: requests.get(url, headers=headers, timeout=timeout)
+                None, lambda: WebContentFetcher._get(url, headers, timeout)
             )
 
             if response.status_code != 200:
@@ -219,32 +236,17 @@ class WebSearch(BaseTool):
         Returns:
             A structured response containing search results and metadata
         """
-        # Get settings from config
-        retry_delay = (
-            getattr(config.search_config, "retry_delay", 60)
-            if config.search_config
-            else 60
-        )
-        max_retries = (
-            getattr(config.search_config, "max_retries", 3)
-            if config.search_config
-            else 3
-        )
+        # Get settings from config; SearchSettings always defines these fields
+        search_config = config.search_config
+        retry_delay = search_config.retry_delay if search_config else 60
+        max_retries = search_config.max_retries if search_config else 3
 
         # Use config values for lang and country if not specified
         if lang is None:
-            lang = (
-                getattr(config.search_config, "lang", "en")
-                if config.search_config
-                else "en"
-            )
+            lang = search_config.lang if search_config else "en"
 
         if country is None:
-            country = (
-                getattr(config.search_config, "country", "us")
-                if config.search_config
-                else "us"
-            )
+            country = search_config.country if search_config else "us"
 
         search_params = {"lang": lang, "country": country}
 
@@ -333,8 +335,18 @@ class WebSearch(BaseTool):
         if not results:
             return []
 
-        # Create tasks for each result
-        tasks = [self._fetch_single_result_content(result) for result in results]
+        # A single result needs neither the semaphore nor gather
+        if len(results) == 1:
+            return [await self._fetch_single_result_content(results[0])]
+
+        # Create tasks for each result, limiting how many fetch at once
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+
+        async def fetch_with_limit(result: SearchResult) -> SearchResult:
+            async with semaphore:
+                return await self._fetch_single_result_content(result)
+
+        tasks = [fetch_with_limit(result) for result in results]
 
         # Type annotation to help type checker
         fetched_results = await asyncio.gather(*tasks)
@@ -359,15 +371,11 @@ class WebSearch(BaseTool):
 
     def _get_engine_order(self) -> List[str]:
         """Determines the order in which to try search engines."""
-        preferred = (
-            getattr(config.search_config, "engine", "google").lower()
-            if config.search_config
-            else "google"
-        )
+        search_config = config.search_config
+        preferred = search_config.engine.lower() if search_config else "google"
         fallbacks = (
-            [engine.lower() for engine in config.search_config.fallback_engines]
-            if config.search_config
-            and hasattr(config.search_config, "fallback_engines")
+            [engine.lower() for engine in search_config.fallback_engines]
+            if search_config
             else []
         )
 
@@ -15,6 +15,8 @@ class A2AManus(Manus):
 
     async def invoke(self, query, sessionId) -> str:
         config = {"configurable": {"thread_id": sessionId}}
+        # The agent is reused across turns, so give every turn a full step budget
+        self.current_step = 0
         response = await self.run(query)
         return self.get_agent_response(config, response)
 
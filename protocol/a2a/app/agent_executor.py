@@ -1,4 +1,7 @@
+import asyncio
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import Event, EventQueue
@@ -16,17 +19,56 @@ from a2a.utils import (
 )
 from .agent import A2AManus
 from a2a.utils.errors import ServerError
-from typing import Callable, Awaitable
+from typing import Awaitable, Callable, Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Most recently used conversations whose agents are kept alive between turns
+MAX_CACHED_AGENTS = 32
+
+
+@dataclass
+class _ContextAgent:
+    """Agent of one conversation and the lock that runs its turns in order."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    agent: Optional[A2AManus] = None
+    # Turns running or waiting on the lock; only entries at zero are evicted
+    turns: int = 0
+
 
 class ManusExecutor(AgentExecutor):
     """Currency Conversion AgentExecutor Example."""
 
     def __init__(self, agent_factory: Callable[[], Awaitable[A2AManus]]):
         self.agent_factory = agent_factory
+        self.contexts: OrderedDict[str, _ContextAgent] = OrderedDict()
+
+    def _enter_context(self, context_id: str) -> _ContextAgent:
+        """Return the cache entry for a context and register a pending turn."""
+        entry = self.contexts.get(context_id)
+        if entry is None:
+            entry = self.contexts[context_id] = _ContextAgent()
+        else:
+            self.contexts.move_to_end(context_id)
+        entry.turns += 1
+        return entry
+
+    def _leave_context(self, context_id: str, entry: _ContextAgent) -> None:
+        """Finish a turn, dropping failed entries and evicting idle ones."""
+        entry.turns -= 1
+        if entry.agent is None and entry.turns == 0:
+            # Agent creation failed and nobody else is waiting to retry it
+            if self.contexts.get(context_id) is entry:
+                del self.contexts[context_id]
+
+        # Evict least recently used contexts, skipping any with turns in flight
+        excess = len(self.contexts) - MAX_CACHED_AGENTS
+        if excess > 0:
+            idle = [cid for cid, e in self.contexts.items() if e.turns == 0]
+            for cid in idle[:excess]:
+                del self.contexts[cid]
 
     async def execute(
         self,
@@ -39,8 +81,14 @@ class ManusExecutor(AgentExecutor):
 
         query = context.get_user_input()
         try:
-            self.agent = await self.agent_factory()
-            result = await self.agent.invoke(query, context.context_id)
+            entry = self._enter_context(context.context_id)
+            try:
+                async with entry.lock:
+                    if entry.agent is None:
+                        entry.agent = await self.agent_factory()
+                    result = await entry.agent.invoke(query, context.context_id)
+            finally:
+                self._leave_context(context.context_id, entry)
             print(f"Final Result ===> {result}")
         except Exception as e:
             print("Error invoking agent: %s", e)
@@ -109,7 +109,7 @@ def run_server(host: Optional[str] = "localhost", port: Optional[int] = 10000):
 
         app = asyncio.run(main(host, port))
         config = uvicorn.Config(
-            app=app, host=host, port=port, loop="asyncio", proxy_headers=True
+            app=app, host=host, port=port, loop="auto", proxy_headers=True
         )
         uvicorn.Server(config=config).run()
         logger.info(f"Server started on {host}:{port}")
@@ -28,12 +28,12 @@ async def run_flow():
         logger.warning("Processing your request...")
 
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             result = await asyncio.wait_for(
                 flow.execute(prompt),
                 timeout=3600,  # 60 minute timeout for the entire execution
             )
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
             logger.info(f"Request processed in {elapsed_time:.2f} seconds")
             logger.info(result)
         except asyncio.TimeoutError:
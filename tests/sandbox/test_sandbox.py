@@ -45,6 +45,26 @@ async def test_sandbox_file_operations(sandbox):
     content = await sandbox.read_file("/workspace/test.txt")
     assert content.strip() == test_content
 
+    # Missing parent directories are created by the upload itself
+    await sandbox.write_file("/workspace/nested/dir/test.txt", test_content)
+    content = await sandbox.read_file("/workspace/nested/dir/test.txt")
+    assert content.strip() == test_content
+
+
+@pytest.mark.asyncio
+async def test_sandbox_copy_round_trip(sandbox, tmp_path):
+    """Tests copying a file into a new container directory and back out."""
+    src = tmp_path / "upload.txt"
+    src.write_text("Copied into sandbox")
+
+    await sandbox.copy_to(str(src), "/workspace/copied/dir/upload.txt")
+    content = await sandbox.read_file("/workspace/copied/dir/upload.txt")
+    assert content == "Copied into sandbox"
+
+    dst = tmp_path / "download.txt"
+    await sandbox.copy_from("/workspace/copied/dir/upload.txt", str(dst))
+    assert dst.read_text() == "Copied into sandbox"
+
 
 @pytest.mark.asyncio
 async def test_sandbox_python_execution(sandbox):
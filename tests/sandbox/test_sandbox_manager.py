@@ -88,6 +88,9 @@ async def test_get_nonexistent_sandbox(manager):
     with pytest.raises(KeyError, match="Sandbox .* not found"):
         await manager.get_sandbox("nonexistent-id")
 
+    # Failed lookups must not leave a lock behind
+    assert "nonexistent-id" not in manager._locks
+
 
 @pytest.mark.asyncio
 async def test_sandbox_cleanup(manager):
@@ -134,5 +137,48 @@ async def test_manager_cleanup(manager):
     assert not manager._last_used
 
 
+@pytest.mark.asyncio
+async def test_warm_pool():
+    """Tests default sandboxes are handed out from the warm pool."""
+    manager = SandboxManager(max_sandboxes=2, warm_pool_size=1)
+    try:
+        # Wait for the initial fill
+        await manager._refill_task
+        assert len(manager._warm_pool) == 1
+        warm_sandbox, _ = manager._warm_pool[0]
+
+        sandbox_id = await manager.create_sandbox()
+        assert manager._sandboxes[sandbox_id] is warm_sandbox
+
+        sandbox = await manager.get_sandbox(sandbox_id)
+        result = await sandbox.run_command("echo 'test'")
+        assert result.strip() == "test"
+    finally:
+        await manager.cleanup()
+
+    assert not manager._warm_pool
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_refills_after_delete():
+    """Tests the warm pool grows back once a sandbox frees capacity."""
+    manager = SandboxManager(max_sandboxes=1, warm_pool_size=1)
+    try:
+        await manager._refill_task
+        sandbox_id = await manager.create_sandbox()
+
+        # The only slot is taken, so the pool cannot be refilled yet
+        await manager._refill_task
+        assert not manager._warm_pool
+
+        await manager.delete_sandbox(sandbox_id)
+        await manager._refill_task
+        assert len(manager._warm_pool) == 1
+    finally:
+        await manager.cleanup()
+
+    assert not manager._warm_pool
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])